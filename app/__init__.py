@@ -5,5 +5,11 @@ Ollama Tray App - A system tray application to control and monitor Ollama AI mod
 from .version import VERSION as __version__
 
 # Export main classes for easy imports
-from .models import ModelManager
 from .config import get_config, save_config
+
+def __getattr__(name):
+    # ModelManager pulls in requests, so only import it when it is asked for
+    if name == "ModelManager":
+        from .models import ModelManager
+        return ModelManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -3,7 +3,17 @@
 Entry point for running the app as a module: python -m app
 """
 
-from .ollama_tray import main
+import sys
+
+def main():
+    # Answer --version without importing PyQt5 and the rest of the tray
+    if "--version" in sys.argv[1:]:
+        from .version import get_version_string
+        print(f"Ollama Tray {get_version_string()}")
+        return
+
+    from .ollama_tray import main as tray_main
+    tray_main()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -19,8 +19,18 @@ DEFAULT_CONFIG = {
 # Configuration file path
 CONFIG_FILE = os.path.expanduser("~/.config/ollama-tray/config.json")
 
-def get_config():
-    """Load configuration from file or return defaults"""
+# Last loaded configuration as (file mtime, config); reloaded when the file changes
+_cache = None
+
+def _config_mtime():
+    """Modification time of the config file, or None if it does not exist"""
+    try:
+        return os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+def _load_config():
+    """Read configuration from disk merged over the defaults"""
     config = DEFAULT_CONFIG.copy()
 
     try:
@@ -39,12 +49,23 @@ def get_config():
 
     return config
 
+def get_config():
+    """Load configuration from file or return defaults"""
+    global _cache
+    mtime = _config_mtime()
+    if _cache is None or _cache[0] != mtime:
+        _cache = (mtime, _load_config())
+    # Callers may modify the returned dict, so never hand out the cached one
+    return dict(_cache[1])
+
 def save_config(config):
     """Save configuration to file"""
+    global _cache
     try:
         os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
         with open(CONFIG_FILE, 'w') as f:
             json.dump(config, f, indent=2)
+        _cache = None
         return True
     except Exception as e:
         print(f"Failed to save configuration: {e}")
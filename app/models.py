@@ -4,28 +4,103 @@ Model management utilities for Ollama Tray
 """
 
 import os
-import json
+import re
+import shutil
+import asyncio
+import atexit
+import time
+import hashlib
 import logging
+import threading
 import requests
-import subprocess
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional; it parses API responses straight from bytes and much faster
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 logger = logging.getLogger('ollama-tray.models')
 
+PROGRESS_LINE_SPLIT = re.compile(rb"[\r\n]")
+DISK_USAGE_TTL = 300  # seconds before a cached disk usage is recomputed regardless
+
+class PullCancel:
+    """Cancels a pull_model() call from another thread, killing its `ollama pull` process"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._task = None
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+            if self._task is not None:
+                self._task.get_loop().call_soon_threadsafe(self._task.cancel)
+
+    def _bind(self, task):
+        """Attach the running pull task; False if the pull was cancelled before it started"""
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._task = task
+            return True
+
+    def _unbind(self):
+        with self._lock:
+            self._task = None
+
 class ModelManager:
     def __init__(self, api_url, model_dir):
         self.api_url = api_url
         self.model_dir = os.path.expanduser(model_dir)
-        self.timeout = 5  # seconds for API requests
+        self.timeout = (0.3, 2.0)  # (connect, read) seconds for API requests
+
+        # Reuse one keep-alive connection pool for all API calls. No retries, so a
+        # stopped server fails immediately with connection refused
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=0, connect=0, read=0, status=0)
+        )
+        self.session.mount("http://", adapter)
+        atexit.register(self.session.close)
+
+        # Cached /api/tags response, keyed by ETag or body hash
+        self._tags_etag = None
+        self._tags_hash = None
+        self._tags_cached = []
+
+        # Cached disk usage as (directory signature, size in MB, monotonic timestamp)
+        self._du_cache = None
+        # Whether model_dir is its own mount point; probed on first disk usage call
+        self._model_dir_is_mount = None
 
     def list_models(self):
         """List all available models from Ollama API"""
         try:
-            res = requests.get(urljoin(self.api_url, "/api/tags"), timeout=self.timeout)
+            headers = {"If-None-Match": self._tags_etag} if self._tags_etag else None
+            res = self.session.get(urljoin(self.api_url, "/api/tags"), headers=headers, timeout=self.timeout)
+            if res.status_code == 304:
+                return self._tags_cached
             if res.ok:
-                return res.json().get("models", [])
+                digest = hashlib.blake2b(res.content, digest_size=8).hexdigest()
+                if digest != self._tags_hash:
+                    self._tags_cached = _json.loads(res.content).get("models", [])
+                    self._tags_hash = digest
+                # Store the ETag last: list_models runs on several threads, and a concurrent
+                # caller must not get a 304 for this ETag while the old list is still cached
+                self._tags_etag = res.headers.get("ETag")
+                return self._tags_cached
             logger.warning(f"Failed to get models: HTTP {res.status_code}")
             return []
+        except requests.exceptions.ConnectionError:
+            logger.debug("Connection refused listing models - Ollama service might be down")
+            return []
         except Exception as e:
             logger.error(f"Error listing models: {e}")
             return []
@@ -33,42 +108,75 @@ class ModelManager:
     def get_model_details(self, model_name):
         """Get detailed information about a specific model"""
         try:
-            res = requests.post(
+            res = self.session.post(
                 urljoin(self.api_url, "/api/show"),
                 json={"name": model_name},
                 timeout=self.timeout
             )
             if res.ok:
-                return res.json()
+                return _json.loads(res.content)
             logger.warning(f"Failed to get model details: HTTP {res.status_code}")
             return {}
+        except requests.exceptions.ConnectionError:
+            logger.debug("Connection refused getting model details - Ollama service might be down")
+            return {}
         except Exception as e:
             logger.error(f"Error getting model details: {e}")
             return {}
 
-    def pull_model(self, model_name, callback=None):
-        """Pull a model from Ollama library"""
+    async def _pull_async(self, model_name, callback=None, cancel=None):
+        """Run `ollama pull` and report each progress line as soon as it arrives"""
+        if cancel is not None and not cancel._bind(asyncio.current_task()):
+            raise asyncio.CancelledError()
         try:
-            cmd = ["ollama", "pull", model_name]
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+            process = await asyncio.create_subprocess_exec(
+                "ollama", "pull", model_name,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
             )
 
-            for line in process.stdout:
-                if callback:
-                    callback(line.strip())
-                logger.info(f"Pull progress: {line.strip()}")
+            def report(raw):
+                line = raw.decode(errors="replace").strip()
+                if line:
+                    if callback:
+                        callback(line)
+                    logger.debug("Pull progress: %s", line)
+
+            try:
+                # Ollama redraws its progress bars with \r, so split on both line endings
+                buffer = b""
+                while True:
+                    chunk = await process.stdout.read(256)
+                    if not chunk:
+                        break
+                    *lines, buffer = PROGRESS_LINE_SPLIT.split(buffer + chunk)
+                    for raw in lines:
+                        report(raw)
+                report(buffer)
 
-            return_code = process.wait()
+                return await process.wait()
+            finally:
+                # Do not leave `ollama pull` running when the callback raised or the pull was cancelled
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+        finally:
+            if cancel is not None:
+                cancel._unbind()
+
+    def pull_model(self, model_name, callback=None, cancel=None):
+        """Pull a model from Ollama library; cancel is an optional PullCancel"""
+        try:
+            return_code = asyncio.run(self._pull_async(model_name, callback, cancel))
             if return_code != 0:
                 logger.error(f"Failed to pull model {model_name}, return code: {return_code}")
                 return False
 
+            self._du_cache = None
             return True
+        except asyncio.CancelledError:
+            logger.info(f"Pull of model {model_name} cancelled")
+            return False
         except Exception as e:
             logger.error(f"Error pulling model: {e}")
             return False
@@ -76,35 +184,78 @@ class ModelManager:
     def remove_model(self, model_name):
         """Remove a model from Ollama"""
         try:
-            res = requests.delete(
+            res = self.session.delete(
                 urljoin(self.api_url, "/api/delete"),
                 json={"name": model_name},
                 timeout=self.timeout
             )
             if res.ok:
                 logger.info(f"Successfully removed model {model_name}")
+                self._du_cache = None
                 return True
             logger.warning(f"Failed to remove model: HTTP {res.status_code}")
             return False
+        except requests.exceptions.ConnectionError:
+            logger.warning("Could not remove model - Ollama service is not reachable")
+            return False
         except Exception as e:
             logger.error(f"Error removing model: {e}")
             return False
 
+    def _dir_signature(self):
+        """Modification times of the models directory and its direct subdirectories"""
+        # Ollama keeps files under blobs/ and manifests/, so the top-level mtime alone
+        # does not change when a model is pulled or removed
+        signature = [os.stat(self.model_dir).st_mtime_ns]
+        with os.scandir(self.model_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    signature.append(entry.stat(follow_symlinks=False).st_mtime_ns)
+        return tuple(signature)
+
     def get_disk_usage(self):
         """Get disk usage information for models directory"""
         try:
             if not os.path.exists(self.model_dir):
                 return 0
 
+            # A dedicated filesystem holds nothing but models, so its used space is the answer
+            if self._model_dir_is_mount is None:
+                self._model_dir_is_mount = os.path.ismount(self.model_dir)
+            if self._model_dir_is_mount:
+                return shutil.disk_usage(self.model_dir).used / (1024 * 1024)
+
+            signature = self._dir_signature()
+            # Read once: pull_model and remove_model reset the cache from other threads
+            cache = self._du_cache
+            if cache is not None:
+                cached_signature, cached_size, cached_at = cache
+                if cached_signature == signature and time.monotonic() - cached_at < DISK_USAGE_TTL:
+                    return cached_size
+
+            # Walk with scandir so file sizes come from the cached dirent stat
             total_size = 0
-            for path, dirs, files in os.walk(self.model_dir):
-                for f in files:
-                    fp = os.path.join(path, f)
-                    if os.path.exists(fp):
-                        total_size += os.path.getsize(fp)
+            stack = [self.model_dir]
+            while stack:
+                try:
+                    it = os.scandir(stack.pop())
+                except OSError:
+                    # Unreadable, or removed by Ollama mid-walk; like os.walk, skip just this directory
+                    continue
+                with it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            try:
+                                total_size += entry.stat(follow_symlinks=False).st_size
+                            except FileNotFoundError:
+                                pass
 
             # Return size in MB
-            return total_size / (1024 * 1024)
+            size_mb = total_size / (1024 * 1024)
+            self._du_cache = (signature, size_mb, time.monotonic())
+            return size_mb
         except Exception as e:
             logger.error(f"Error getting disk usage: {e}")
             return 0
@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 
-import sys, os, subprocess, psutil, requests, logging
+import sys, os, subprocess, logging, logging.handlers, atexit
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction, QMessageBox
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 
 # Import local modules
 from .config import get_config, save_config
 from .models import ModelManager
+from .probes import Probes
 from .ui import AboutDialog, ConfigDialog, ModelsDialog
 from .version import get_version_string
 
@@ -20,7 +22,11 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler(config.get('log_file', '~/.cache/ollama-tray.log'))
+        logging.handlers.RotatingFileHandler(
+            config.get('log_file', '~/.cache/ollama-tray.log'),
+            maxBytes=1_000_000,
+            backupCount=3
+        )
     ]
 )
 logger = logging.getLogger('ollama-tray')
@@ -32,18 +38,90 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 ICON_PATH = os.path.join(SCRIPT_DIR, "icon_64.png")  # Use smaller icon for system tray
 MODEL_DIR = config.get('model_dir', '~/.ollama/models')
 REFRESH_INTERVAL = config.get('refresh_interval', 15000)  # ms
+MAX_REFRESH_INTERVAL = max(REFRESH_INTERVAL, 120000)  # ms, ceiling for idle backoff
+
+# Tray icon, decoded once on first use
+_ICON_CACHE = None
+
+def _icon():
+    """Return the shared tray icon, loading it on first call"""
+    global _ICON_CACHE
+    if _ICON_CACHE is None:
+        _ICON_CACHE = QIcon(ICON_PATH)
+    return _ICON_CACHE
+
+class RefreshSignals(QObject):
+    """Carries RefreshWorker results back to the GUI thread"""
+    finished = pyqtSignal(dict)
+
+class RefreshWorker(QRunnable):
+    """Runs the status probes concurrently off the GUI thread"""
+    def __init__(self, probes, executor, signals):
+        super().__init__()
+        self.probes = probes
+        self.executor = executor
+        self.signals = signals
+
+    def run(self):
+        # Probe name -> (callable, value used if the probe itself raises)
+        checks = {
+            "running": (self.probes.service_running, False),
+            "model_status": (self.probes.model_status, ([], "Ollama not responding")),
+            "gpu_info": (self.probes.gpu_memory, "Error reading GPU"),
+            "token_info": (self.probes.token_usage, "-"),
+        }
+        results = {}
+        try:
+            futures = {name: self.executor.submit(probe) for name, (probe, _) in checks.items()}
+            # Like asyncio.gather(return_exceptions=True): one failing probe must not
+            # discard the others
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Error in {name} probe: {e}", exc_info=True)
+                    results[name] = checks[name][1]
+            results["models"], results["model_msg"] = results.pop("model_status")
+        except Exception as e:
+            logger.error(f"Error during refresh: {e}", exc_info=True)
+            results = {}
+        self.signals.finished.emit(results)
 
 class OllamaTray:
+    # Menu texts indexed by the service running flag
+    _STATUS = ("Status: Stopped", "Status: Running")
+
     def __init__(self, app):
         self.app = app
-        self.tray = QSystemTrayIcon(QIcon(ICON_PATH))
+        self.tray = QSystemTrayIcon(_icon())
         self.tray.setToolTip("Ollama Service Monitor")
         self.menu = QMenu()
-        self.last_model_count = 0
+        self._last_model_hash = hash(frozenset())
         self.model_manager = ModelManager(OLLAMA_URL, MODEL_DIR)
         self.config = config
+        self.probes = Probes(SERVICE_NAME, OLLAMA_URL, self.model_manager)
+
+        # Dialogs are built on first use and reused afterwards
+        self._about_dialog = None
+        self._settings_dialog = None
+        self._models_dialog = None
+
         self.setup_ui()
 
+        # Single-shot timer re-armed after every refresh (see _schedule_refresh)
+        self._interval = REFRESH_INTERVAL
+        self._last_state = None
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.refresh)
+
+        # Status probes run on a worker thread; results come back via refresh_signals
+        self._refresh_inflight = False
+        self.probe_executor = ThreadPoolExecutor(max_workers=4)
+        atexit.register(self.probe_executor.shutdown, wait=False)
+        self.refresh_signals = RefreshSignals()
+        self.refresh_signals.finished.connect(self.apply_refresh)
+
     def setup_ui(self):
         # Status indicators
         self.status_action = QAction("Status: checking...", self.menu)
@@ -103,6 +181,7 @@ class OllamaTray:
         self.menu.addAction(quit_action)
 
         self.tray.setContextMenu(self.menu)
+        self.menu.aboutToShow.connect(self.on_menu_shown)
         
         # Log menu structure for debugging
         logger.info(f"Menu has {len(self.menu.actions())} actions")
@@ -112,7 +191,7 @@ class OllamaTray:
     def start_ollama(self):
         logger.info("Starting Ollama service")
         try:
-            subprocess.Popen(["systemctl", "--user", "start", SERVICE_NAME])
+            self.probes.control_service("start")
             QTimer.singleShot(2000, self.refresh)  # Refresh after a delay
         except Exception as e:
             logger.error(f"Failed to start Ollama: {e}", exc_info=True)
@@ -121,7 +200,7 @@ class OllamaTray:
     def stop_ollama(self):
         logger.info("Stopping Ollama service")
         try:
-            subprocess.Popen(["systemctl", "--user", "stop", SERVICE_NAME])
+            self.probes.control_service("stop")
             QTimer.singleShot(2000, self.refresh)  # Refresh after a delay
         except Exception as e:
             logger.error(f"Failed to stop Ollama: {e}")
@@ -136,89 +215,90 @@ class OllamaTray:
             logger.error(f"Failed to open model folder: {e}", exc_info=True)
             self.show_error(f"Failed to open model folder: {e}")
 
-    def is_service_running(self):
-        try:
-            output = subprocess.check_output(["systemctl", "--user", "is-active", SERVICE_NAME])
-            return output.strip() == b"active"
-        except subprocess.CalledProcessError:
-            return False
-        except Exception as e:
-            logger.error(f"Error checking service status: {e}")
-            return False
-
-    def get_model_status(self):
-        try:
-            models = self.model_manager.list_models()
-            if models is not None:
-                return models, f"{len(models)} model(s) loaded" if models else "No models loaded"
-            logger.warning("Failed to get models from API")
-        except requests.exceptions.ConnectionError:
-            logger.debug("Connection refused - Ollama service might be down")
-        except requests.exceptions.Timeout:
-            logger.warning("Timeout connecting to Ollama API")
-        except Exception as e:
-            logger.error(f"Error getting model status: {e}")
-        return [], "Ollama not responding"
+    def on_menu_shown(self):
+        """Refresh immediately and drop any backoff when the user opens the menu"""
+        self._last_state = None
+        self.refresh()
 
-    def get_token_usage(self):
-        try:
-            res = requests.get(f"{OLLAMA_URL}/api/generate/status", timeout=1)
-            if res.ok:
-                data = res.json()
-                tokens = data.get("context_size", 0)
-                used = data.get("context_used", 0)
-                return f"{used}/{tokens} tokens"
-            logger.debug(f"Token usage API returned status code: {res.status_code}")
-        except Exception as e:
-            logger.debug(f"Error getting token usage: {e}")
-        return "-"
+    def _schedule_refresh(self, state):
+        """Double the poll interval while nothing changes, reset it on any change"""
+        if state is not None and state == self._last_state:
+            self._interval = min(self._interval * 2, MAX_REFRESH_INTERVAL)
+        else:
+            self._interval = REFRESH_INTERVAL
+        self._last_state = state
+        self.timer.start(self._interval)
 
-    def get_gpu_memory(self):
-        try:
-            output = subprocess.check_output(["nvidia-smi", "--query-gpu=memory.used,memory.total", "--format=csv,noheader,nounits"])
-            used, total = map(int, output.decode().strip().split(','))
-            return f"{used} MiB / {total} MiB"
-        except subprocess.SubprocessError:
-            return "NVIDIA GPU not found"
-        except Exception as e:
-            logger.error(f"Error getting GPU info: {e}")
-            return "Error reading GPU"
+    def _set(self, action, text):
+        """Update a menu action's text only when it actually changed"""
+        if action.text() != text:
+            action.setText(text)
 
     def refresh(self):
-        logger.info("Refreshing status")
+        """Start a background status refresh unless one is already in flight"""
+        if self._refresh_inflight:
+            logger.debug("Refresh already in progress, skipping")
+            return
+        logger.debug("Refreshing status")
+        self._refresh_inflight = True
+        QThreadPool.globalInstance().start(
+            RefreshWorker(self.probes, self.probe_executor, self.refresh_signals)
+        )
+
+    def apply_refresh(self, results):
+        """Update the menu from RefreshWorker results; runs in the GUI thread"""
+        self._refresh_inflight = False
+        state = None
         try:
-            running = self.is_service_running()
-            self.status_action.setText(f"Status: {'Running' if running else 'Stopped'}")
-            logger.info(f"Service running: {running}")
-
-            models, model_msg = self.get_model_status()
-            self.model_action.setText(f"Models: {model_msg}")
-            logger.info(f"Models: {model_msg}")
-
-            if running:
-                gpu_info = self.get_gpu_memory()
-                self.gpu_action.setText(f"GPU: {gpu_info}")
-                logger.info(f"GPU: {gpu_info}")
-                
-                token_info = self.get_token_usage()
-                self.token_action.setText(f"Context: {token_info}")
-                logger.info(f"Context: {token_info}")
-
-            if running and len(models) != self.last_model_count:
-                self.tray.showMessage("Ollama Status", model_msg, QSystemTrayIcon.Information, 3000)
-                self.last_model_count = len(models)
+            if results:
+                running = results["running"]
+                models, model_msg = results["models"], results["model_msg"]
+                gpu_info = token_info = None
+
+                self._set(self.status_action, self._STATUS[running])
+                logger.debug("Service running: %s", running)
+
+                self._set(self.model_action, "Models: " + model_msg)
+                logger.debug("Models: %s", model_msg)
+
+                if running:
+                    gpu_info = results["gpu_info"]
+                    self._set(self.gpu_action, "GPU: " + gpu_info)
+                    logger.debug("GPU: %s", gpu_info)
+
+                    token_info = results["token_info"]
+                    self._set(self.token_action, "Context: " + token_info)
+                    logger.debug("Context: %s", token_info)
+
+                # Compare the set of model names so a pull plus a removal between
+                # ticks still counts as a change
+                model_hash = hash(frozenset(m.get("name", "") for m in models))
+                if running and model_hash != self._last_model_hash:
+                    self.tray.showMessage("Ollama Status", model_msg, QSystemTrayIcon.Information, 3000)
+                    self._last_model_hash = model_hash
+
+                state = (running, model_hash, gpu_info, token_info)
         except Exception as e:
             logger.error(f"Error during refresh: {e}", exc_info=True)
 
+        self._schedule_refresh(state)
+
     def show_error(self, message):
         QMessageBox.critical(None, "Ollama Tray Error", message)
 
+    def _present(self, dialog):
+        """Show a dialog, bringing it to the front if it is already open"""
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
+
     def show_model_management(self):
         """Show the model management dialog"""
         try:
-            dialog = ModelsDialog(self.model_manager)
-            dialog.exec_()
-            self.refresh()  # Refresh after dialog closes
+            if self._models_dialog is None:
+                self._models_dialog = ModelsDialog(self.model_manager)
+                self._models_dialog.finished.connect(lambda _: self.refresh())  # Refresh after dialog closes
+            self._present(self._models_dialog)
         except Exception as e:
             logger.error(f"Error showing models dialog: {e}", exc_info=True)
             self.show_error(f"Failed to open models dialog: {e}")
@@ -226,25 +306,36 @@ class OllamaTray:
     def show_settings(self):
         """Show the settings dialog"""
         try:
-            dialog = ConfigDialog(self.config)
-            if dialog.exec_() == dialog.Accepted:
-                # Settings were saved, reload config
-                self.config = get_config()
-                QMessageBox.information(None, "Restart Required",
-                                       "Some settings will take effect after restarting the application.")
+            if self._settings_dialog is None:
+                self._settings_dialog = ConfigDialog(self.config)
+                self._settings_dialog.accepted.connect(self.on_settings_saved)
+            elif not self._settings_dialog.isVisible():
+                self._settings_dialog.set_config(self.config)
+            self._present(self._settings_dialog)
         except Exception as e:
             logger.error(f"Error showing settings dialog: {e}", exc_info=True)
             self.show_error(f"Failed to open settings dialog: {e}")
 
+    def on_settings_saved(self):
+        # Settings were saved, reload config
+        self.config = get_config()
+        QMessageBox.information(None, "Restart Required",
+                               "Some settings will take effect after restarting the application.")
+
     def show_about(self):
         """Show the about dialog"""
         try:
-            dialog = AboutDialog()
-            dialog.exec_()
+            if self._about_dialog is None:
+                self._about_dialog = AboutDialog()
+            self._present(self._about_dialog)
         except Exception as e:
             logger.error(f"Error showing about dialog: {e}", exc_info=True)
             self.show_error(f"Failed to open about dialog: {e}")
 
+    def on_quit(self):
+        if self._models_dialog is not None:
+            self._models_dialog.wait_for_workers()
+
     def run(self):
         logger.info("Starting Ollama Tray application")
         
@@ -256,18 +347,15 @@ class OllamaTray:
         
         # Set the application not to quit when last window closes
         self.app.setQuitOnLastWindowClosed(False)
+        self.app.aboutToQuit.connect(self.on_quit)
         
         # Show a notification
         if QSystemTrayIcon.supportsMessages():
             self.tray.showMessage("Ollama Tray", "Application started", QSystemTrayIcon.Information, 3000)
         
+        # Initial refresh also arms the adaptive refresh timer
         self.refresh()
 
-        # Set up the refresh timer
-        timer = QTimer()
-        timer.timeout.connect(self.refresh)
-        timer.start(REFRESH_INTERVAL)
-
         logger.info("Starting main event loop")
         return self.app.exec_()
 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Status probes for the Ollama service, API and GPU
+"""
+
+import atexit
+import logging
+import requests
+import subprocess
+
+# QtDBus is packaged separately on some distros; without it the probes use systemctl
+try:
+    from PyQt5.QtDBus import QDBus, QDBusConnection, QDBusInterface, QDBusMessage, QDBusObjectPath, QDBusVariant
+except ImportError:
+    QDBusConnection = None
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+logger = logging.getLogger('ollama-tray.probes')
+
+SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+SYSTEMD_PATH = "/org/freedesktop/systemd1"
+
+# Upper bound for probe subprocesses, so a hung command cannot stall the refresh
+# worker (and with it every later refresh) indefinitely
+PROBE_TIMEOUT = 5  # seconds
+
+def _dbus_value(value):
+    """Unwrap QtDBus wrapper types found in reply arguments"""
+    if isinstance(value, QDBusVariant):
+        return value.variant()
+    if isinstance(value, QDBusObjectPath):
+        return value.path()
+    return value
+
+class Probes:
+    def __init__(self, service_name, api_url, model_manager):
+        self.service_name = service_name
+        self.api_url = api_url
+        self.model_manager = model_manager
+
+        # Shared HTTP session so status polls reuse a keep-alive connection
+        self.session = requests.Session()
+        atexit.register(self.session.close)
+
+        self.systemd_manager, self.dbus_unit = self._connect_systemd()
+
+        # NVML is initialised lazily on the first GPU probe
+        self._nvml = None
+        self.nvml_handle = None
+        self._nvml_tried = False
+
+    def _connect_systemd(self):
+        """Resolve the service unit path on the user session bus once, or (None, None) without D-Bus"""
+        if QDBusConnection is None:
+            logger.info("QtDBus not available, using systemctl")
+            return None, None
+        try:
+            bus = QDBusConnection.sessionBus()
+            if not bus.isConnected():
+                logger.info("Session D-Bus not available, using systemctl")
+                return None, None
+
+            manager = QDBusInterface(SYSTEMD_BUS_NAME, SYSTEMD_PATH, "org.freedesktop.systemd1.Manager", bus)
+            reply = manager.call("LoadUnit", self.service_name)
+            if reply.type() == QDBusMessage.ErrorMessage:
+                logger.info(f"Could not resolve {self.service_name} over D-Bus: {reply.errorMessage()}")
+                return None, None
+
+            return manager, _dbus_value(reply.arguments()[0])
+        except Exception as e:
+            logger.warning(f"Error connecting to systemd over D-Bus: {e}")
+            return None, None
+
+    def control_service(self, verb):
+        """Start or stop the service via D-Bus, falling back to systemctl"""
+        if self.systemd_manager is not None:
+            method = "StartUnit" if verb == "start" else "StopUnit"
+            reply = self.systemd_manager.call(method, self.service_name, "replace")
+            if reply.type() != QDBusMessage.ErrorMessage:
+                return
+            logger.warning(f"D-Bus {method} failed: {reply.errorMessage()}")
+        subprocess.Popen(["systemctl", "--user", verb, self.service_name])
+
+    def service_running(self):
+        """Whether the systemd user service is active"""
+        if self.dbus_unit is not None:
+            # Plain method call rather than a QDBusInterface: this runs on a worker thread
+            message = QDBusMessage.createMethodCall(
+                SYSTEMD_BUS_NAME, self.dbus_unit, "org.freedesktop.DBus.Properties", "Get"
+            )
+            message.setArguments(["org.freedesktop.systemd1.Unit", "ActiveState"])
+            # Bounded like the subprocess fallbacks; the default D-Bus timeout is about 25 s
+            reply = QDBusConnection.sessionBus().call(message, QDBus.Block, PROBE_TIMEOUT * 1000)
+            if reply.type() != QDBusMessage.ErrorMessage:
+                return _dbus_value(reply.arguments()[0]) == "active"
+            logger.debug("D-Bus ActiveState query failed: %s", reply.errorMessage())
+        try:
+            output = subprocess.check_output(
+                ["systemctl", "--user", "is-active", self.service_name], timeout=PROBE_TIMEOUT
+            )
+            return output.strip() == b"active"
+        except subprocess.CalledProcessError:
+            return False
+        except subprocess.TimeoutExpired:
+            logger.warning("systemctl is-active timed out")
+            return False
+        except Exception as e:
+            logger.error(f"Error checking service status: {e}")
+            return False
+
+    def model_status(self):
+        """Installed models and a summary message for the menu"""
+        try:
+            models = self.model_manager.list_models()
+            if models is not None:
+                return models, f"{len(models)} model(s) loaded" if models else "No models loaded"
+            logger.warning("Failed to get models from API")
+        except requests.exceptions.ConnectionError:
+            logger.debug("Connection refused - Ollama service might be down")
+        except requests.exceptions.Timeout:
+            logger.warning("Timeout connecting to Ollama API")
+        except Exception as e:
+            logger.error(f"Error getting model status: {e}")
+        return [], "Ollama not responding"
+
+    def token_usage(self):
+        """Context usage of the running model as 'used/total tokens'"""
+        try:
+            res = self.session.get(f"{self.api_url}/api/generate/status", timeout=(0.3, 1))
+            if res.ok:
+                data = _json.loads(res.content)
+                tokens = data.get("context_size", 0)
+                used = data.get("context_used", 0)
+                return f"{used}/{tokens} tokens"
+            logger.debug("Token usage API returned status code: %s", res.status_code)
+        except Exception as e:
+            logger.debug("Error getting token usage: %s", e)
+        return "-"
+
+    def _get_nvml_handle(self):
+        """Initialise NVML on first use and cache the handle for GPU 0"""
+        if not self._nvml_tried:
+            self._nvml_tried = True
+            try:
+                import pynvml
+                pynvml.nvmlInit()
+                atexit.register(pynvml.nvmlShutdown)
+                self._nvml = pynvml
+                self.nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            except ImportError:
+                logger.debug("pynvml not installed, using nvidia-smi")
+            except Exception as e:
+                logger.debug(f"NVML not available, using nvidia-smi: {e}")
+        return self.nvml_handle
+
+    def gpu_memory(self):
+        """GPU memory usage as 'used MiB / total MiB'"""
+        handle = self._get_nvml_handle()
+        if handle is not None:
+            try:
+                info = self._nvml.nvmlDeviceGetMemoryInfo(handle)
+                return "%d MiB / %d MiB" % (info.used >> 20, info.total >> 20)
+            except Exception as e:
+                logger.debug("NVML memory query failed: %s", e)
+        try:
+            output = subprocess.check_output(
+                ["nvidia-smi", "--query-gpu=memory.used,memory.total", "--format=csv,noheader,nounits"],
+                timeout=PROBE_TIMEOUT
+            )
+            used, total = map(int, output.decode().strip().split(','))
+            return "%d MiB / %d MiB" % (used, total)
+        except subprocess.TimeoutExpired:
+            logger.warning("nvidia-smi timed out")
+            return "Error reading GPU"
+        except subprocess.SubprocessError:
+            return "NVIDIA GPU not found"
+        except Exception as e:
+            logger.error(f"Error getting GPU info: {e}")
+            return "Error reading GPU"
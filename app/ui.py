@@ -4,25 +4,69 @@ UI components for Ollama Tray application
 """
 
 import os
+import re
 import sys
+import shutil
 import logging
+import functools
+# Only the widgets every dialog needs are imported here; dialog-specific ones are
+# imported where they are used so loading this module stays cheap at tray startup
 from PyQt5.QtWidgets import (
-    QDialog, QTabWidget, QVBoxLayout, QHBoxLayout, QLabel, QWidget,
-    QLineEdit, QSpinBox, QPushButton, QFileDialog, QComboBox,
-    QFormLayout, QGroupBox, QCheckBox, QDialogButtonBox,
-    QTextBrowser, QTableWidget, QTableWidgetItem, QHeaderView,
-    QProgressBar, QMessageBox, QInputDialog
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QDialogButtonBox, QMessageBox
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QIcon, QPixmap, QFont
+from PyQt5.QtCore import Qt, QThread, QTimer, QProcess, pyqtSignal, pyqtSlot
 
 from .version import get_version_info
 from .config import save_config, DEFAULT_CONFIG
+from .models import PullCancel
 
 logger = logging.getLogger('ollama-tray.ui')
 
+# Terminal emulators in order of preference, with the flag that precedes the command
+TERMINALS = (
+    ("konsole", "-e"),              # KDE Konsole
+    ("gnome-terminal", "--"),       # GNOME Terminal
+    ("xterm", "-e"),                # xterm (fallback)
+    ("x-terminal-emulator", "-e"),  # Generic x-terminal-emulator (Debian/Ubuntu)
+)
+
+# Pull progress lines worth showing; searched without lowercasing each line
+_DOWNLOAD_RE = re.compile(r'download', re.I)
+
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+# How often and how many times to poll for the service after starting it
+SERVICE_START_POLL_MS = 200
+SERVICE_START_POLLS = 10
+
+# Longest a background model operation may hold up quitting the tray
+WORKER_WAIT_MS = 5000
+
+@functools.lru_cache(maxsize=32)
+def _expand(path):
+    """os.path.expanduser, memoized for paths shown in the settings dialog"""
+    return os.path.expanduser(path)
+
+# First of TERMINALS found on PATH, looked up on first use
+_CACHED_TERM = None
+
+def _find_terminal():
+    """Return the (name, flag) of the preferred installed terminal, or None"""
+    global _CACHED_TERM
+    if _CACHED_TERM is None:
+        for name, flag in TERMINALS:
+            if shutil.which(name):
+                _CACHED_TERM = (name, flag)
+                break
+    return _CACHED_TERM
+
 class AboutDialog(QDialog):
     """About dialog showing version information"""
+    # Scaled app icon shared by every instance, loaded on first open
+    _icon_pixmap = None
+    _icon_missing = False
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("About Ollama Tray")
@@ -30,15 +74,23 @@ class AboutDialog(QDialog):
         self.init_ui()
 
     def init_ui(self):
+        from PyQt5.QtWidgets import QFormLayout, QGroupBox
+        from PyQt5.QtGui import QPixmap
+
         layout = QVBoxLayout()
 
         # App name and icon
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon.png")
-        if os.path.exists(icon_path):
+        if AboutDialog._icon_pixmap is None and not AboutDialog._icon_missing:
+            icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon.png")
+            if os.path.exists(icon_path):
+                AboutDialog._icon_pixmap = QPixmap(icon_path).scaled(64, 64, Qt.KeepAspectRatio)
+            else:
+                AboutDialog._icon_missing = True
+
+        if AboutDialog._icon_pixmap is not None:
             icon_layout = QHBoxLayout()
             icon_label = QLabel()
-            icon_pixmap = QPixmap(icon_path).scaled(64, 64, Qt.KeepAspectRatio)
-            icon_label.setPixmap(icon_pixmap)
+            icon_label.setPixmap(AboutDialog._icon_pixmap)
             icon_layout.addWidget(icon_label)
 
             app_name = QLabel("Ollama Tray")
@@ -63,14 +115,14 @@ class AboutDialog(QDialog):
         layout.addWidget(version_group)
 
         # Description
-        description = QTextBrowser()
-        description.setMaximumHeight(100)
-        description.setOpenExternalLinks(True)
-        description.setHtml("""
+        description = QLabel("""
         <p>A lightweight Linux system tray application to monitor and control the Ollama model server.</p>
         <p>Project repository: <a href="https://github.com/seanGSISG/ollama-tray">github.com/seanGSISG/ollama-tray</a></p>
         <p>License: MIT</p>
         """)
+        description.setTextFormat(Qt.RichText)
+        description.setOpenExternalLinks(True)
+        description.setWordWrap(True)
         layout.addWidget(description)
 
         # OK button
@@ -87,10 +139,13 @@ class ConfigDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Ollama Tray Settings")
         self.setMinimumWidth(500)
-        self.config = current_config.copy()
+        # Defaults fill any keys missing from the saved config
+        self.config = {**DEFAULT_CONFIG, **current_config}
         self.init_ui()
 
     def init_ui(self):
+        from PyQt5.QtWidgets import QTabWidget, QWidget, QFormLayout, QLineEdit, QSpinBox
+
         layout = QVBoxLayout()
 
         tabs = QTabWidget()
@@ -100,16 +155,16 @@ class ConfigDialog(QDialog):
         general_layout = QFormLayout()
 
         # Service name
-        self.service_name = QLineEdit(self.config.get("service_name", DEFAULT_CONFIG["service_name"]))
+        self.service_name = QLineEdit(self.config["service_name"])
         general_layout.addRow("Service Name:", self.service_name)
 
         # API URL
-        self.api_url = QLineEdit(self.config.get("api_url", DEFAULT_CONFIG["api_url"]))
+        self.api_url = QLineEdit(self.config["api_url"])
         general_layout.addRow("API URL:", self.api_url)
 
         # Model directory with browse button
         model_dir_layout = QHBoxLayout()
-        self.model_dir = QLineEdit(self.config.get("model_dir", DEFAULT_CONFIG["model_dir"]))
+        self.model_dir = QLineEdit(self.config["model_dir"])
         model_dir_layout.addWidget(self.model_dir)
 
         browse_btn = QPushButton("Browse...")
@@ -123,19 +178,45 @@ class ConfigDialog(QDialog):
         self.refresh_interval.setRange(1000, 60000)
         self.refresh_interval.setSingleStep(1000)
         self.refresh_interval.setSuffix(" ms")
-        self.refresh_interval.setValue(int(self.config.get("refresh_interval", DEFAULT_CONFIG["refresh_interval"])))
+        self.refresh_interval.setValue(int(self.config["refresh_interval"]))
         general_layout.addRow("Refresh Interval:", self.refresh_interval)
 
         general_tab.setLayout(general_layout)
         tabs.addTab(general_tab, "General")
 
-        # Logging Tab
-        logging_tab = QWidget()
+        # Logging Tab, populated the first time it is shown
+        self.tabs = tabs
+        self.logging_tab = QWidget()
+        self.log_file = None
+        self.log_level = None
+        tabs.addTab(self.logging_tab, "Logging")
+        tabs.currentChanged.connect(self._build_logging_tab_once)
+
+        # Add tabs to layout
+        layout.addWidget(tabs)
+
+        # Buttons
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.save_settings)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+        self.setLayout(layout)
+
+    @pyqtSlot(int)
+    def _build_logging_tab_once(self, index):
+        """Create the Logging tab widgets on the first visit to that tab"""
+        from PyQt5.QtWidgets import QFormLayout, QLineEdit, QComboBox
+
+        if self.tabs.widget(index) is not self.logging_tab:
+            return
+        self.tabs.currentChanged.disconnect(self._build_logging_tab_once)
+
         logging_layout = QFormLayout()
 
         # Log file
         log_file_layout = QHBoxLayout()
-        self.log_file = QLineEdit(self.config.get("log_file", DEFAULT_CONFIG["log_file"]))
+        self.log_file = QLineEdit(self.config["log_file"])
         log_file_layout.addWidget(self.log_file)
 
         log_browse_btn = QPushButton("Browse...")
@@ -146,54 +227,63 @@ class ConfigDialog(QDialog):
 
         # Log level
         self.log_level = QComboBox()
-        log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        self.log_level.addItems(log_levels)
-
-        current_level = self.config.get("log_level", DEFAULT_CONFIG["log_level"])
-        level_index = log_levels.index(current_level) if current_level in log_levels else 1  # Default to INFO
-        self.log_level.setCurrentIndex(level_index)
+        self.log_level.addItems(LOG_LEVELS)
+        self._select_log_level(self.config["log_level"])
 
         logging_layout.addRow("Log Level:", self.log_level)
 
-        logging_tab.setLayout(logging_layout)
-        tabs.addTab(logging_tab, "Logging")
-
-        # Add tabs to layout
-        layout.addWidget(tabs)
-
-        # Buttons
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(self.save_settings)
-        button_box.rejected.connect(self.reject)
-        layout.addWidget(button_box)
+        self.logging_tab.setLayout(logging_layout)
 
-        self.setLayout(layout)
+    def _select_log_level(self, level):
+        level_index = LOG_LEVELS.index(level) if level in LOG_LEVELS else 1  # Default to INFO
+        self.log_level.setCurrentIndex(level_index)
 
+    def set_config(self, current_config):
+        """Reset the fields to current_config, discarding unsaved edits"""
+        self.config = {**DEFAULT_CONFIG, **current_config}
+        self.service_name.setText(self.config["service_name"])
+        self.api_url.setText(self.config["api_url"])
+        self.model_dir.setText(self.config["model_dir"])
+        self.refresh_interval.setValue(int(self.config["refresh_interval"]))
+        if self.log_file is not None:
+            self.log_file.setText(self.config["log_file"])
+            self._select_log_level(self.config["log_level"])
+
+    def _collect_logging(self):
+        """Logging settings from the tab, or the current values if it was never opened"""
+        if self.log_file is None:
+            return self.config["log_file"], self.config["log_level"]
+        return self.log_file.text(), self.log_level.currentText()
+
+    @pyqtSlot()
     def browse_model_dir(self):
+        from PyQt5.QtWidgets import QFileDialog
         directory = QFileDialog.getExistingDirectory(
             self, "Select Models Directory",
-            os.path.expanduser(self.model_dir.text())
+            _expand(self.model_dir.text())
         )
         if directory:
             self.model_dir.setText(directory)
 
+    @pyqtSlot()
     def browse_log_file(self):
+        from PyQt5.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Select Log File",
-            os.path.expanduser(self.log_file.text()),
+            _expand(self.log_file.text()),
             "Log Files (*.log);;All Files (*)"
         )
         if file_path:
             self.log_file.setText(file_path)
 
+    @pyqtSlot()
     def save_settings(self):
         # Build config from UI values
         self.config["service_name"] = self.service_name.text()
         self.config["api_url"] = self.api_url.text()
         self.config["model_dir"] = self.model_dir.text()
         self.config["refresh_interval"] = self.refresh_interval.value()
-        self.config["log_file"] = self.log_file.text()
-        self.config["log_level"] = self.log_level.currentText()
+        self.config["log_file"], self.config["log_level"] = self._collect_logging()
 
         # Save to file
         if save_config(self.config):
@@ -214,10 +304,34 @@ class ModelsDialog(QDialog):
         self.setWindowTitle("Manage Ollama Models")
         self.setMinimumSize(600, 400)
         self.model_list = []
+
+        # Coalesces bursts of load_models() calls into one reload
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._do_load_models)
+
+        # Only one ModelListThread runs at a time; a reload requested meanwhile
+        # is started once it finishes
+        self._loading = False
+        self._reload_pending = False
+
+        # Background workers, parented to the dialog and reaped once they finish
+        self.list_thread = None
+        self.pull_thread = None
+        self.remove_thread = None
+
+        # Pull progress is buffered here and shown at most every 100 ms
+        self._latest_progress = ""
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         self.init_ui()
-        self.load_models()
 
     def init_ui(self):
+        from PyQt5.QtWidgets import QTableWidget, QHeaderView, QGroupBox, QProgressBar
+
         layout = QVBoxLayout()
 
         # Model stats
@@ -287,43 +401,98 @@ class ModelsDialog(QDialog):
 
         self.setLayout(layout)
 
+    @pyqtSlot()
     def load_models(self):
-        """Load models from API and display in table"""
+        """Schedule a model list reload; calls within 150 ms collapse into one"""
+        self._refresh_timer.start()
+
+    @pyqtSlot()
+    def _do_load_models(self):
+        """Fetch models and disk usage in the background"""
+        if self._loading:
+            self._reload_pending = True
+            return
+
+        self._loading = True
+        self.list_thread = ModelListThread(self.model_manager, parent=self)
+        self.list_thread.result.connect(self._apply_model_list)
+        self.list_thread.finished.connect(self._on_list_thread_finished)
+        self.list_thread.start()
+
+    @pyqtSlot()
+    def _on_list_thread_finished(self):
+        """Start any reload that was requested while the last one was running"""
+        self.list_thread.deleteLater()
+        self.list_thread = None
+        self._loading = False
+        if self._reload_pending:
+            self._reload_pending = False
+            self._do_load_models()
+
+    @pyqtSlot(list, float)
+    def _apply_model_list(self, models, disk_usage):
+        """Display fetched models in table"""
+        from PyQt5.QtWidgets import QTableWidgetItem, QHeaderView
+
         self.models_table.setRowCount(0)
-        self.model_list = self.model_manager.list_models()
+        self.model_list = models
 
         if not self.model_list:
             self.model_count_label.setText("No models found")
-            disk_usage = self.model_manager.get_disk_usage()
             self.disk_usage_label.setText(f"Disk usage: {disk_usage:.1f} MB")
             return
 
         self.model_count_label.setText(f"{len(self.model_list)} models")
 
         # Update disk usage
-        disk_usage = self.model_manager.get_disk_usage()
         self.disk_usage_label.setText(f"Disk usage: {disk_usage:.1f} MB")
 
-        # Populate table
-        self.models_table.setRowCount(len(self.model_list))
-
-        for i, model in enumerate(self.model_list):
-            # Model name
-            name_item = QTableWidgetItem(model.get("name", ""))
-            self.models_table.setItem(i, 0, name_item)
-
-            # Size
-            size_mb = model.get("size", 0) / (1024 * 1024)
-            size_item = QTableWidgetItem(f"{size_mb:.1f} MB")
-            self.models_table.setItem(i, 1, size_item)
-
-            # Tags
-            tags = ", ".join(model.get("tags", []))
-            tags_item = QTableWidgetItem(tags if tags else "none")
-            self.models_table.setItem(i, 2, tags_item)
+        # Populate table as one bulk update: with updates, signals, sorting and the
+        # auto-sizing header modes suspended, the layout is computed once at the end
+        table = self.models_table
+        header = table.horizontalHeader()
+        resize_modes = [header.sectionResizeMode(i) for i in range(table.columnCount())]
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        for i in range(len(resize_modes)):
+            header.setSectionResizeMode(i, QHeaderView.Interactive)
 
+        try:
+            table.setRowCount(len(self.model_list))
+            to_mb = 1.0 / (1024 * 1024)
+
+            for i, model in enumerate(self.model_list):
+                # Model name
+                name_item = QTableWidgetItem(model.get("name", ""))
+                table.setItem(i, 0, name_item)
+
+                # Size
+                size_mb = model.get("size", 0) * to_mb
+                size_item = QTableWidgetItem(f"{size_mb:.1f} MB")
+                table.setItem(i, 1, size_item)
+
+                # Tags
+                tags = ", ".join(model.get("tags", []))
+                tags_item = QTableWidgetItem(tags if tags else "none")
+                table.setItem(i, 2, tags_item)
+        finally:
+            for i, mode in enumerate(resize_modes):
+                header.setSectionResizeMode(i, mode)
+            table.setSortingEnabled(sorting)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    @pyqtSlot()
     def pull_model_dialog(self):
         """Show dialog to pull a new model"""
+        from PyQt5.QtWidgets import QInputDialog
+
+        if self.pull_thread is not None:
+            QMessageBox.information(self, "Pull In Progress", "Please wait for the current download to finish.")
+            return
+
         model_name, ok = QInputDialog.getText(
             self, "Pull Model",
             "Enter model name to download (e.g., 'llama2', 'llama2:7b'):"
@@ -333,32 +502,32 @@ class ModelsDialog(QDialog):
             # Show progress
             self.progress_group.setVisible(True)
             self.progress_label.setText(f"Downloading {model_name}...")
-
-            # Define callback for progress updates
-            def update_progress(line):
-                if "download" in line.lower():
-                    self.progress_label.setText(line)
+            self._latest_progress = ""
+            self._progress_timer.start()
 
             # Pull in a background thread
-            class PullThread(QThread):
-                finished_signal = pyqtSignal(bool)
-
-                def __init__(self, model_manager, model_name, callback):
-                    super().__init__()
-                    self.model_manager = model_manager
-                    self.model_name = model_name
-                    self.callback = callback
-
-                def run(self):
-                    result = self.model_manager.pull_model(self.model_name, self.callback)
-                    self.finished_signal.emit(result)
-
-            self.pull_thread = PullThread(self.model_manager, model_name, update_progress)
+            self.pull_thread = PullThread(self.model_manager, model_name, parent=self)
+            self.pull_thread.progress.connect(self._on_pull_progress)
             self.pull_thread.finished_signal.connect(self.on_pull_finished)
             self.pull_thread.start()
 
+    @pyqtSlot(str)
+    def _on_pull_progress(self, line):
+        """Remember the latest progress line for the next timer tick"""
+        self._latest_progress = line
+
+    @pyqtSlot()
+    def _flush_progress(self):
+        """Show the latest progress line if it changed"""
+        if self._latest_progress and self._latest_progress != self.progress_label.text():
+            self.progress_label.setText(self._latest_progress)
+
+    @pyqtSlot(bool)
     def on_pull_finished(self, success):
         """Handle completion of model pull operation"""
+        self._reap_thread(self.pull_thread)
+        self.pull_thread = None
+        self._progress_timer.stop()
         self.progress_group.setVisible(False)
 
         if success:
@@ -369,8 +538,36 @@ class ModelsDialog(QDialog):
         # Refresh model list
         self.load_models()
 
+    def _reap_thread(self, thread):
+        """Wait for a worker that signalled completion to return from run(), then delete it"""
+        thread.wait()
+        thread.deleteLater()
+
+    def showEvent(self, event):
+        # The dialog is reused between opens, so reload the list every time it is shown
+        super().showEvent(event)
+        self.load_models()
+
+    def wait_for_workers(self):
+        """Cancel a running pull and wait a bounded time for background model operations"""
+        # A download can take minutes, so stop it rather than wait it out
+        if self.pull_thread is not None:
+            self.pull_thread.cancel()
+
+        # A parented QThread must not be destroyed with the dialog while it is still running
+        for thread in (self.list_thread, self.pull_thread, self.remove_thread):
+            if thread is not None and thread.isRunning():
+                logger.info("Waiting for background model operation to finish")
+                if not thread.wait(WORKER_WAIT_MS):
+                    logger.warning("Background model operation still running after %d ms", WORKER_WAIT_MS)
+
+    @pyqtSlot()
     def remove_selected_model(self):
         """Remove the selected model"""
+        if self.remove_thread is not None:
+            QMessageBox.information(self, "Removal In Progress", "Please wait for the current removal to finish.")
+            return
+
         selected_items = self.models_table.selectedItems()
         if not selected_items:
             QMessageBox.information(self, "No Selection", "Please select a model to delete.")
@@ -393,24 +590,15 @@ class ModelsDialog(QDialog):
             self.progress_label.setText(f"Removing {model_name}...")
 
             # Remove in a background thread
-            class RemoveThread(QThread):
-                finished_signal = pyqtSignal(bool)
-
-                def __init__(self, model_manager, model_name):
-                    super().__init__()
-                    self.model_manager = model_manager
-                    self.model_name = model_name
-
-                def run(self):
-                    result = self.model_manager.remove_model(self.model_name)
-                    self.finished_signal.emit(result)
-
-            self.remove_thread = RemoveThread(self.model_manager, model_name)
+            self.remove_thread = RemoveThread(self.model_manager, model_name, parent=self)
             self.remove_thread.finished_signal.connect(self.on_remove_finished)
             self.remove_thread.start()
 
+    @pyqtSlot(bool)
     def on_remove_finished(self, success):
         """Handle completion of model removal operation"""
+        self._reap_thread(self.remove_thread)
+        self.remove_thread = None
         self.progress_group.setVisible(False)
 
         if success:
@@ -421,6 +609,7 @@ class ModelsDialog(QDialog):
         # Refresh model list
         self.load_models()
     
+    @pyqtSlot()
     def run_model_in_terminal(self):
         """Run the selected model in a terminal"""
         selected_items = self.models_table.selectedItems()
@@ -432,51 +621,128 @@ class ModelsDialog(QDialog):
         row = selected_items[0].row()
         model_name = self.models_table.item(row, 0).text()
         
-        # Check if service is running
-        try:
-            import subprocess
-            result = subprocess.run(['systemctl', '--user', 'is-active', 'ollama.service'], 
-                                  capture_output=True, text=True)
-            if result.stdout.strip() != 'active':
-                reply = QMessageBox.question(
-                    self, "Service Not Running",
-                    "Ollama service is not running. Would you like to start it first?",
-                    QMessageBox.Yes | QMessageBox.No
-                )
-                if reply == QMessageBox.Yes:
-                    subprocess.run(['systemctl', '--user', 'start', 'ollama.service'])
-                    # Wait a moment for service to start
-                    import time
-                    time.sleep(2)
-        except Exception as e:
-            logger.warning(f"Could not check service status: {e}")
-        
-        # Try different terminal emulators in order of preference
-        terminal_commands = [
-            # KDE Konsole
-            ['konsole', '-e', 'bash', '-c', f'ollama run {model_name}; echo "Press Enter to close..."; read'],
-            # GNOME Terminal
-            ['gnome-terminal', '--', 'bash', '-c', f'ollama run {model_name}; echo "Press Enter to close..."; read'],
-            # xterm (fallback)
-            ['xterm', '-e', 'bash', '-c', f'ollama run {model_name}; echo "Press Enter to close..."; read'],
-            # Generic x-terminal-emulator (Debian/Ubuntu)
-            ['x-terminal-emulator', '-e', 'bash', '-c', f'ollama run {model_name}; echo "Press Enter to close..."; read']
-        ]
-        
-        # Try each terminal command
-        for cmd in terminal_commands:
+        # Check if service is running; the terminal is launched from the callbacks
+        self._systemctl(["is-active", "ollama.service"],
+                        lambda state: self._on_service_checked(model_name, state))
+
+    def _systemctl(self, args, callback):
+        """Run `systemctl --user` without blocking; callback gets its output, or None if it failed to run"""
+        process = QProcess(self)
+
+        def finished(exit_code, exit_status):
+            output = bytes(process.readAllStandardOutput()).decode().strip()
+            process.deleteLater()
+            callback(output)
+
+        def error_occurred(error):
+            if error == QProcess.FailedToStart:
+                logger.warning(f"Could not run systemctl {' '.join(args)}: {process.errorString()}")
+                process.deleteLater()
+                callback(None)
+
+        process.finished.connect(finished)
+        process.errorOccurred.connect(error_occurred)
+        process.start("systemctl", ["--user"] + args)
+
+    def _on_service_checked(self, model_name, state):
+        """Offer to start the service if it is not running, then launch the terminal"""
+        if state is not None and state != "active":
+            reply = QMessageBox.question(
+                self, "Service Not Running",
+                "Ollama service is not running. Would you like to start it first?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply == QMessageBox.Yes:
+                self._systemctl(["start", "ollama.service"],
+                                lambda _: self._wait_for_service(model_name, SERVICE_START_POLLS))
+                return
+
+        self._launch_terminal(model_name)
+
+    def _wait_for_service(self, model_name, attempts):
+        """Poll until the service is active or attempts run out, then launch the terminal"""
+        def checked(state):
+            if state == "active" or state is None or attempts <= 1:
+                self._launch_terminal(model_name)
+            else:
+                QTimer.singleShot(SERVICE_START_POLL_MS,
+                                  lambda: self._wait_for_service(model_name, attempts - 1))
+
+        self._systemctl(["is-active", "ollama.service"], checked)
+
+    def _launch_terminal(self, model_name):
+        """Open the preferred installed terminal emulator running the model"""
+        import subprocess
+
+        terminal = _find_terminal()
+        if terminal is not None:
+            name, flag = terminal
+            cmd = [name, flag, 'bash', '-c', f'ollama run {model_name}; echo "Press Enter to close..."; read']
             try:
-                import subprocess
                 subprocess.Popen(cmd)
                 logger.info(f"Launched terminal with model: {model_name}")
                 return
-            except FileNotFoundError:
-                continue
             except Exception as e:
-                logger.error(f"Error launching terminal with {cmd[0]}: {e}")
-                continue
-        
+                logger.error(f"Error launching terminal with {name}: {e}")
+
         # If we get here, no terminal worked
         QMessageBox.critical(self, "Error", 
                            "Could not find a suitable terminal emulator.\n"
                            "Please run manually: ollama run " + model_name)
+
+
+class ModelListThread(QThread):
+    """Fetches the model list and disk usage in the background"""
+    result = pyqtSignal(list, float)
+
+    def __init__(self, model_manager, parent=None):
+        super().__init__(parent)
+        self.model_manager = model_manager
+
+    def run(self):
+        models = self.model_manager.list_models()
+        if models:
+            # The API already reports each model's size, so skip walking the models directory
+            disk_usage = sum(m.get("size", 0) for m in models) * (1.0 / (1024 * 1024))
+        else:
+            disk_usage = self.model_manager.get_disk_usage()
+        self.result.emit(models, float(disk_usage))
+
+
+class PullThread(QThread):
+    """Pulls a model in the background"""
+    progress = pyqtSignal(str)
+    finished_signal = pyqtSignal(bool)
+
+    def __init__(self, model_manager, model_name, parent=None):
+        super().__init__(parent)
+        self.model_manager = model_manager
+        self.model_name = model_name
+        self._cancel = PullCancel()
+
+    def cancel(self):
+        """Stop the pull and kill its `ollama pull` process; finished_signal still follows"""
+        self._cancel.cancel()
+
+    def update_progress(self, line):
+        # Called on this thread; the signal hands the line to the GUI thread
+        if _DOWNLOAD_RE.search(line):
+            self.progress.emit(line)
+
+    def run(self):
+        result = self.model_manager.pull_model(self.model_name, self.update_progress, self._cancel)
+        self.finished_signal.emit(result)
+
+
+class RemoveThread(QThread):
+    """Removes a model in the background"""
+    finished_signal = pyqtSignal(bool)
+
+    def __init__(self, model_manager, model_name, parent=None):
+        super().__init__(parent)
+        self.model_manager = model_manager
+        self.model_name = model_name
+
+    def run(self):
+        result = self.model_manager.remove_model(self.model_name)
+        self.finished_signal.emit(result)
@@ -4,30 +4,51 @@ Version information for Ollama Tray Application
 """
 
 import os
-import subprocess
+import sys
+import functools
 from datetime import datetime
 
 # Version constants
 VERSION = "0.3.0"
 BUILD_DATE = "2025-06-07"  # ISO format YYYY-MM-DD
 
+GIT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".git")
+
+def _git_rev():
+    """Short revision of the checkout this package runs from, read from .git without forking git"""
+    try:
+        with open(os.path.join(GIT_DIR, "HEAD")) as f:
+            head = f.read().strip()
+        if not head.startswith("ref: "):
+            return head[:7]  # detached HEAD
+
+        ref = head[5:]
+        try:
+            with open(os.path.join(GIT_DIR, ref)) as f:
+                return f.read().strip()[:7]
+        except FileNotFoundError:
+            # Refs are moved into packed-refs by git gc
+            with open(os.path.join(GIT_DIR, "packed-refs")) as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2 and parts[1] == ref:
+                        return parts[0][:7]
+    except OSError:
+        pass
+    return "unknown"
+
+@functools.lru_cache(maxsize=1)
 def get_version_info():
     """Returns dictionary with version information"""
+    # Nothing here changes while the process runs, so this is computed only once
     info = {
         "version": VERSION,
         "build_date": BUILD_DATE,
-        "python_version": subprocess.check_output(["python3", "--version"]).decode().strip(),
+        "python_version": f"Python {sys.version.split()[0]}",
     }
 
     # Try to get git revision if we're in a git repo
-    try:
-        git_rev = subprocess.check_output(
-            ["git", "rev-parse", "--short", "HEAD"],
-            stderr=subprocess.DEVNULL
-        ).decode().strip()
-        info["git_revision"] = git_rev
-    except (subprocess.SubprocessError, FileNotFoundError):
-        info["git_revision"] = "unknown"
+    info["git_revision"] = _git_rev()
 
     return info
 